@@ -1,7 +1,16 @@
 #!/usr/bin/env python3
+import io
 import struct
 import os
-from PIL import Image
+from concurrent.futures import ThreadPoolExecutor
+
+# Big-endian 32-bit length field used by the ICNS header and every entry
+_U32BE = struct.Struct('>I')
+
+def read_bytes(path):
+    """Return the raw contents of a file"""
+    with open(path, 'rb') as f:
+        return f.read()
 
 def create_icns_from_pngs(output_path):
     """Create ICNS file from PNG images (Linux compatible)"""
@@ -22,39 +31,39 @@ def create_icns_from_pngs(output_path):
         (b'ic10', 1024),  # 1024x1024
     ]
     
-    # Collect all icon data
-    icon_data = []
-    total_size = 8  # Header size
-    
-    for icon_type, size in icon_types:
-        # Use our generated PNG files
-        png_path = os.path.join(assets_path, f'icon-{size}x{size}.png')
-        
-        if os.path.exists(png_path):
-            with open(png_path, 'rb') as f:
-                png_data = f.read()
-            
-            # Each icon entry: 4 bytes type + 4 bytes size + data
-            entry_size = 8 + len(png_data)
-            icon_data.append((icon_type, entry_size, png_data))
-            total_size += entry_size
-            print(f"Added {size}x{size} icon ({len(png_data)} bytes)")
-    
-    if not icon_data:
+    # List the assets directory once instead of probing for each size
+    try:
+        files = {entry.name: entry.path for entry in os.scandir(assets_path)}
+    except FileNotFoundError:
+        files = {}
+    
+    # Use our generated PNG files
+    found = [
+        (icon_type, size, files[f'icon-{size}x{size}.png'])
+        for icon_type, size in icon_types
+        if f'icon-{size}x{size}.png' in files
+    ]
+    
+    if not found:
         print("No icon files found!")
         return
     
-    # Write ICNS file
+    # Read the PNGs concurrently; file reads release the GIL
+    with ThreadPoolExecutor() as executor:
+        blobs = list(executor.map(read_bytes, [path for _, _, path in found]))
+    
+    # Collect all icon entries in memory
+    body = io.BytesIO()
+    for (icon_type, size, _), png_data in zip(found, blobs):
+        # Each icon entry: 4 bytes type + 4 bytes size + data
+        body.write(icon_type + _U32BE.pack(8 + len(png_data)) + png_data)
+        print(f"Added {size}x{size} icon ({len(png_data)} bytes)")
+    
+    # Write header and all entries in a single write
+    payload = body.getvalue()
+    total_size = 8 + len(payload)
     with open(output_path, 'wb') as f:
-        # Write header
-        f.write(icns_header)
-        f.write(struct.pack('>I', total_size))
-        
-        # Write each icon
-        for icon_type, entry_size, png_data in icon_data:
-            f.write(icon_type)
-            f.write(struct.pack('>I', entry_size))
-            f.write(png_data)
+        f.write(icns_header + _U32BE.pack(total_size) + payload)
     
     print(f"Created ICNS file: {output_path} ({total_size} bytes)")
 
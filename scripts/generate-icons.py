@@ -1,7 +1,17 @@
 #!/usr/bin/env python3
+import argparse
+import io
 import os
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+# Sizes written as standalone icon-{size}x{size}.png files
+PNG_SIZES = [16, 24, 32, 48, 64, 128, 256, 512, 1024]
+
+# Resized copies of each base icon, shared by the PNG, ICO and ICNS generators.
+# Keyed by id(base_icon); each entry keeps the icon alive so its id can't be reused
+resized_cache: dict[int, tuple[Image.Image, dict[int, Image.Image]]] = {}
 
 def create_base_icon(size=1024):
     """Create a modern base icon for LocalListen"""
@@ -95,17 +105,49 @@ def create_base_icon(size=1024):
     
     return img
 
+def get_size(base_icon, size):
+    """Return base_icon downsampled to size x size, resizing each size only once"""
+    _, sizes = resized_cache.setdefault(id(base_icon), (base_icon, {}))
+    if size not in sizes:
+        source = base_icon
+        if size <= 128:
+            # Cheap BILINEAR pass to an intermediate size keeps LANCZOS work small
+            mid = int(size * 1.25)
+            source = base_icon.resize((mid, mid), Image.Resampling.BILINEAR)
+        sizes[size] = source.resize((size, size), Image.Resampling.LANCZOS)
+    return sizes[size]
+
+def save_pngs(tasks, **save_options):
+    """Save (image, path) pairs as PNG concurrently; Pillow's encoder releases the GIL"""
+    # Image.save mutates the image's encoderinfo, so each distinct image is
+    # encoded by exactly one worker and its bytes written to every path
+    paths_by_image = {}
+    for image, path in tasks:
+        paths_by_image.setdefault(id(image), (image, []))[1].append(path)
+    
+    def encode_and_write(entry):
+        image, paths = entry
+        buffer = io.BytesIO()
+        image.save(buffer, 'PNG', **save_options)
+        for path in paths:
+            with open(path, 'wb') as f:
+                f.write(buffer.getvalue())
+    
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        list(executor.map(encode_and_write, paths_by_image.values()))
+
 def generate_png_sizes(base_icon):
     """Generate PNG files in various sizes"""
-    sizes = [16, 24, 32, 48, 64, 128, 256, 512, 1024]
-    
-    for size in sizes:
-        resized = base_icon.resize((size, size), Image.Resampling.LANCZOS)
-        resized.save(f'/home/michael/projects/local-listen/public/assets/icon-{size}x{size}.png', 'PNG')
+    # Resize up front so worker threads only encode and write
+    tasks = [
+        (get_size(base_icon, size), f'/home/michael/projects/local-listen/public/assets/icon-{size}x{size}.png')
+        for size in PNG_SIZES
+    ]
     
     # Also save the main icon.png at 512x512
-    main_icon = base_icon.resize((512, 512), Image.Resampling.LANCZOS)
-    main_icon.save('/home/michael/projects/local-listen/public/assets/icon.png', 'PNG')
+    tasks.append((get_size(base_icon, 512), '/home/michael/projects/local-listen/public/assets/icon.png'))
+    
+    save_pngs(tasks)
     print("Generated PNG icons")
 
 def generate_ico(base_icon):
@@ -113,35 +155,16 @@ def generate_ico(base_icon):
     # Windows ICO typically includes these sizes
     sizes = [(16, 16), (24, 24), (32, 32), (48, 48), (256, 256)]
     
-    # Create ICO file manually with all sizes
     ico_path = '/home/michael/projects/local-listen/public/assets/icon.ico'
     
-    # First, save individual PNG files
-    temp_files = []
-    for i, size in enumerate(sizes):
-        img = base_icon.resize(size, Image.Resampling.LANCZOS)
-        temp_path = f'/tmp/icon_{i}_{size[0]}.png'
-        img.save(temp_path, 'PNG')
-        temp_files.append(temp_path)
-    
-    # Create the ICO file
-    images = []
-    for size in sizes:
-        img = base_icon.resize(size, Image.Resampling.LANCZOS)
-        images.append(img)
-    
-    # Save multi-size ICO
-    images[0].save(
+    # Save multi-size ICO from the cached 256x256 image; Pillow's ICO writer
+    # downsamples the smaller entries itself
+    get_size(base_icon, 256).save(
         ico_path,
         format='ICO',
         sizes=sizes
     )
     
-    # Clean up temp files
-    for temp_file in temp_files:
-        if os.path.exists(temp_file):
-            os.remove(temp_file)
-    
     print("Generated Windows ICO file")
 
 def generate_icns(base_icon):
@@ -163,9 +186,11 @@ def generate_icns(base_icon):
         (1024, 'icon_512x512@2x.png')
     ]
     
-    for size, filename in sizes:
-        resized = base_icon.resize((size, size), Image.Resampling.LANCZOS)
-        resized.save(os.path.join(iconset_path, filename), 'PNG')
+    # The iconset is only an input to iconutil, so favour encode speed over file size
+    save_pngs([
+        (get_size(base_icon, size), os.path.join(iconset_path, filename))
+        for size, filename in sizes
+    ], compress_level=1, optimize=False)
     
     # Check if we're on macOS and can use iconutil
     if os.path.exists('/usr/bin/iconutil'):
@@ -184,7 +209,35 @@ def generate_icns(base_icon):
         import shutil
         shutil.rmtree(iconset_path)
 
+def outputs_up_to_date():
+    """Check whether every generated icon is newer than this script"""
+    assets_path = '/home/michael/projects/local-listen/public/assets'
+    outputs = [f'icon-{size}x{size}.png' for size in PNG_SIZES] + ['icon.png', 'icon.ico']
+    
+    # icon.icns is only produced where iconutil is available
+    if os.path.exists('/usr/bin/iconutil'):
+        outputs.append('icon.icns')
+    
+    script_mtime = os.path.getmtime(__file__)
+    return all(
+        os.path.exists(path) and os.path.getmtime(path) > script_mtime
+        for path in (os.path.join(assets_path, name) for name in outputs)
+    )
+
 def main():
+    parser = argparse.ArgumentParser(description="Generate LocalListen app icons")
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help="regenerate even if the icons look up to date (mtimes after a git "
+             "checkout don't reliably reflect when the icons were generated)"
+    )
+    args = parser.parse_args()
+    
+    if not args.force and outputs_up_to_date():
+        print("LocalListen app icons are up to date (use --force to regenerate)")
+        return
+    
     print("Generating LocalListen app icons...")
     
     # Create base icon